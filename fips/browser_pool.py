@@ -0,0 +1,221 @@
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, Optional
+
+from .logger import logger
+from .web import CHROME_BINARY_ENV, CONTENT_PREFS, HEADLESS_ARGS
+
+# Environment variable with the per-user directory for runtime files
+RUNTIME_DIR_ENV = "XDG_RUNTIME_DIR"
+
+# File with the endpoint, process and profile of the shared browser started
+# by this module, kept in runtime_dir()
+LOCKFILE_NAME = "fips-chrome.lock"
+
+# Prefix of the profile directories of shared browsers
+PROFILE_PREFIX = "fips-chrome-"
+
+# Keys and types of a valid lockfile
+LOCK_FIELDS = {"endpoint": str, "browser_id": str, "pid": int, "profile_dir": str}
+
+DEFAULT_PORT = 9222
+STARTUP_TIMEOUT = 15
+
+CHROME_BINARIES = (
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "chrome",
+)
+
+
+def _browser_id(endpoint: str) -> Optional[str]:
+    """Get the debugger URL identifying the browser on the endpoint, if any."""
+    try:
+        with urllib.request.urlopen(
+            f"http://{endpoint}/json/version", timeout=1
+        ) as response:
+            return json.load(response).get("webSocketDebuggerUrl")
+    except (OSError, ValueError):
+        return None
+
+
+def is_alive(endpoint: str) -> bool:
+    """Check that a browser answers on the debugging endpoint."""
+    return _browser_id(endpoint) is not None
+
+
+def runtime_dir() -> Path:
+    """Get the directory for runtime files, accessible to the current user only."""
+    base = os.environ.get(RUNTIME_DIR_ENV)
+    path = Path(base) / "fips" if base else Path.home() / ".cache" / "fips"
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return path
+
+
+def _read_lock() -> Optional[Dict]:
+    """Read the lockfile of the shared browser, if any and well-formed."""
+    try:
+        lock = json.loads((runtime_dir() / LOCKFILE_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(lock, dict) or any(
+        not isinstance(lock.get(key), kind) for key, kind in LOCK_FIELDS.items()
+    ):
+        return None
+    return lock
+
+
+def _is_own_profile(profile_dir: str) -> bool:
+    """Check that a directory is a shared browser profile of the current user."""
+    path = Path(profile_dir)
+    if (
+        path.parent != Path(tempfile.gettempdir())
+        or not path.name.startswith(PROFILE_PREFIX)
+        or path.is_symlink()
+    ):
+        return False
+    try:
+        owner = path.stat().st_uid
+    except OSError:
+        return False
+    return not hasattr(os, "getuid") or owner == os.getuid()
+
+
+def read_endpoint() -> Optional[str]:
+    """Get endpoint of the running shared browser, if any.
+
+    Only a browser started by start_browser() is accepted, not any other
+    Chrome that happens to listen on the same port.
+    """
+    lock = _read_lock()
+    if not lock or _browser_id(lock["endpoint"]) != lock["browser_id"]:
+        return None
+    return lock["endpoint"]
+
+
+def _write_preferences(profile_dir: str) -> None:
+    """Seed profile preferences with the content settings of CONTENT_PREFS."""
+    preferences: Dict = {}
+    for key, value in CONTENT_PREFS.items():
+        *parents, name = key.split(".")
+        node = preferences
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[name] = value
+
+    default_dir = Path(profile_dir) / "Default"
+    default_dir.mkdir(parents=True, exist_ok=True)
+    (default_dir / "Preferences").write_text(json.dumps(preferences), encoding="utf-8")
+
+
+def start_browser(port: int = DEFAULT_PORT) -> str:
+    """Start the shared headless Chrome unless it is already running.
+
+    Args:
+        port: Remote debugging port of the browser
+
+    Returns:
+        Endpoint ("host:port") to attach WebDriver sessions to
+    """
+    endpoint = read_endpoint()
+    if endpoint:
+        return endpoint
+
+    # Clean up after a shared browser that is no longer running
+    stop_browser()
+
+    endpoint = f"127.0.0.1:{port}"
+    if is_alive(endpoint):
+        raise RuntimeError(f"Port {port} is already used by another browser")
+
+    binary = os.environ.get(CHROME_BINARY_ENV) or next(
+        filter(None, map(shutil.which, CHROME_BINARIES)), None
+    )
+    if binary is None:
+        raise FileNotFoundError("Chrome executable not found")
+
+    profile_dir = tempfile.mkdtemp(prefix=PROFILE_PREFIX)
+    _write_preferences(profile_dir)
+    process = subprocess.Popen(
+        [
+            binary,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={profile_dir}",
+            *HEADLESS_ARGS,
+            "--window-size=1920,1080",
+            "--no-sandbox",
+            "--blink-settings=imagesEnabled=false",
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    browser_id = _browser_id(endpoint)
+    while browser_id is None:
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            raise TimeoutError(f"Chrome did not start on {endpoint}")
+        time.sleep(0.2)
+        browser_id = _browser_id(endpoint)
+
+    (runtime_dir() / LOCKFILE_NAME).write_text(
+        json.dumps(
+            {
+                "endpoint": endpoint,
+                "browser_id": browser_id,
+                "pid": process.pid,
+                "profile_dir": profile_dir,
+            }
+        ),
+        encoding="utf-8",
+    )
+    logger.info(f"Shared browser started at {endpoint}")
+    return endpoint
+
+
+def stop_browser() -> bool:
+    """Stop the shared browser and remove its profile.
+
+    Returns:
+        True if a shared browser was running
+    """
+    lock = _read_lock()
+    if not lock:
+        return False
+
+    running = _browser_id(lock["endpoint"]) == lock["browser_id"]
+    if running:
+        try:
+            os.kill(lock["pid"], signal.SIGTERM)
+        except OSError as e:
+            logger.warning(f"Failed to stop shared browser: {e}")
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while is_alive(lock["endpoint"]) and time.monotonic() < deadline:
+            time.sleep(0.2)
+
+    if _is_own_profile(lock["profile_dir"]):
+        shutil.rmtree(lock["profile_dir"], ignore_errors=True)
+    (runtime_dir() / LOCKFILE_NAME).unlink(missing_ok=True)
+    if running:
+        logger.info("Shared browser stopped")
+    return running
+
+
+if __name__ == "__main__":
+    if "--stop" in sys.argv[1:]:
+        stop_browser()
+    else:
+        print(start_browser())
@@ -1,6 +1,15 @@
 import logging
+from logging.handlers import MemoryHandler
 
+# Buffer records and write them in batches, flushing at once on warnings
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+)
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
+    level=logging.INFO,
+    handlers=[
+        MemoryHandler(capacity=100, flushLevel=logging.WARNING, target=_stream_handler)
+    ],
 )
 logger = logging.getLogger(__name__)
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import List
+from typing import Tuple
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StatusOptions:
     active: bool = False  # Действует
     may_terminate: bool = False  # Может прекратить свое действие
@@ -11,8 +11,12 @@ class StatusOptions:
     )
     terminated: bool = False  # Прекратил действие
 
+    def is_default(self) -> bool:
+        """Check if options match the unchecked state of the search page."""
+        return self == StatusOptions()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class PatentHeader:
     """Single patent header at top right corner."""
 
@@ -20,10 +24,10 @@ class PatentHeader:
     country_code: str
     number: str
     kind_code: str
-    ipc_codes: List[str]  # List of IPC codes with dates
+    ipc_codes: Tuple[str, ...]  # IPC codes with dates
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PatentResult:
     """Single patent search result."""
 
@@ -1,7 +1,13 @@
-import time
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlsplit
 
+import lxml.html
+from lxml import etree
+import requests
+from requests.adapters import HTTPAdapter
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
@@ -12,6 +18,95 @@ from fips.models import PatentHeader, PatentResult, StatusOptions
 from fips.storage import PatentStorage
 from fips.web import WebDriverManager
 
+# Default number of threads fetching patent details in parallel
+DETAIL_WORKERS = 8
+
+# Browser tabs loading patent pages together when HTTP fetches fail
+BROWSER_TABS = 4
+
+# Timeout in seconds for patent page requests
+HTTP_TIMEOUT = 30
+
+# Connections kept open to the FIPS server by the HTTP session
+HTTP_POOL_SIZE = 16
+
+# Timeout and polling interval of explicit waits on the search pages
+WAIT_TIMEOUT = 10
+WAIT_POLL_FREQUENCY = 0.2
+
+# Locators of elements queried through Selenium
+LOCATORS = {
+    "result_row": (By.CSS_SELECTOR, "a.tr"),
+    "next_page": (By.CSS_SELECTOR, "a.ui-commandlink.ui-widget.modern-page-next"),
+    "dataset_checkbox": (By.CSS_SELECTOR, "[name*='dbsGrid1:0:dbsGrid1checkbox']"),
+    "search_form_button": (By.CSS_SELECTOR, "input[type='submit'][value='Поиск']"),
+    "bib": (By.ID, "bib"),
+    "no_results": (By.CSS_SELECTOR, ".no-results, .empty-result"),
+}
+
+# CSS selectors passed to the batched extraction scripts
+JS_SELECTORS = {
+    "result_row": "a.tr",
+    "row_cols": "div.td",
+    "row_image": "img",
+    "next_page": LOCATORS["next_page"][1],
+}
+
+# XPath expressions for fields of the patent document page, compiled once
+DOCUMENT_XPATHS = {
+    name: etree.XPath(expression)
+    for name, expression in {
+        "name_doc": "//*[@id='NameDoc']//b",
+        "status": "//*[@id='StatusR']",
+        "country_code": "//*[@id='top2']",
+        "number_link": "//*[@id='top4']//a",
+        "kind_code": "//*[@id='top6']",
+        "ipc_links": (
+            "//ul[contains(concat(' ', normalize-space(@class), ' '), ' ipc ')]"
+            "//li//a"
+        ),
+        "spk": "//*[contains(concat(' ', normalize-space(@class), ' '), ' spk ')]",
+        "bib": "//*[@id='bib']",
+        "title": "//*[@id='B542']",
+    }.items()
+}
+
+# Elements rendered on lines of their own, like in the browser's visible text
+BLOCK_TAGS = frozenset(
+    {
+        "address",
+        "blockquote",
+        "dd",
+        "div",
+        "dl",
+        "dt",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "li",
+        "ol",
+        "p",
+        "section",
+        "table",
+        "td",
+        "th",
+        "tr",
+        "ul",
+    }
+)
+
+# Runs of source whitespace, shown as a single space
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# IPC link text with the code and its date, e.g. "B64C 3/10 (2006.01)"
+IPC_PATTERN = re.compile(r"^\s*(?P<code>.+?)\s*\((?P<date>[^)]+)\)\s*$", re.S)
+
+# Invention title text after its "(54)" marker, up to any repeated marker
+TITLE_PATTERN = re.compile(r"\(54\)(?P<title>.*?)(?:\(54\)|$)", re.S)
+
 
 class FIPSParser:
     """Parser for FIPS patent database."""
@@ -32,6 +127,41 @@ class FIPSParser:
         "status_label": "Статус документа",
     }
 
+    # Script collecting all search result rows in a single call
+    JS_RESULT_ROWS = """
+        const sel = arguments[0];
+        return [...document.querySelectorAll(sel.result_row)].map((a) => {
+            const tds = a.querySelectorAll(sel.row_cols);
+            const img = a.querySelector(sel.row_image);
+            return {
+                id: a.id,
+                n: tds[1]?.textContent.trim() ?? null,
+                d: tds[2]?.textContent.replace(/[()]/g, '').trim() ?? null,
+                t: tds[4]?.textContent.trim() ?? null,
+                dt: tds[5]?.textContent.trim() ?? null,
+                img: img ? img.src : null,
+            };
+        });
+    """
+
+    # Returns the next page button unless it is missing or disabled
+    JS_NEXT_BUTTON = """
+        const button = document.querySelector(arguments[0].next_page);
+        if (!button || button.className.includes('disabled')) {
+            return null;
+        }
+        const onclick = button.getAttribute('onclick');
+        return onclick && onclick !== 'return false;' ? button : null;
+    """
+
+    # Status checkbox labels paired with StatusOptions fields
+    _STATUS_FIELDS = (
+        ("status_active", "active"),
+        ("status_may_terminate", "may_terminate"),
+        ("status_terminated_recoverable", "terminated_recoverable"),
+        ("status_terminated", "terminated"),
+    )
+
     # CSS classes for finding elements
     CSS_CLASSES = {
         "checkbox_container": "oneline",
@@ -45,11 +175,38 @@ class FIPSParser:
         base_dir: Path,
         status_options: Optional[StatusOptions] = None,
         test_mode: bool = False,
+        detail_workers: int = DETAIL_WORKERS,
+        cdp_endpoint: Optional[str] = None,
+        reuse_saved_details: bool = False,
     ):
-        self.driver_manager = WebDriverManager()
-        self.storage = PatentStorage(base_dir / "output")
+        self.driver_manager = WebDriverManager.acquire(cdp_endpoint)
+        self._wait = WebDriverWait(
+            self.driver_manager.driver,
+            WAIT_TIMEOUT,
+            poll_frequency=WAIT_POLL_FREQUENCY,
+        )
+        self._rows_present = EC.presence_of_all_elements_located(LOCATORS["result_row"])
+        self._results_ready = EC.any_of(
+            self._rows_present, EC.presence_of_element_located(LOCATORS["no_results"])
+        )
+        self._no_results = False
+        self.storage = PatentStorage(base_dir / "output", reuse_saved_details)
         self.status_options = status_options or StatusOptions()
         self.test_mode = test_mode
+        self.detail_workers = detail_workers
+        self._main_handle: Optional[str] = None
+        self._detail_handle: Optional[str] = None
+        # Patent pages are plain HTML, fetched over HTTP with the browser session
+        self.http = requests.Session()
+        self.http.headers["Connection"] = "keep-alive"
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_SIZE,
+            pool_maxsize=max(HTTP_POOL_SIZE, detail_workers),
+        )
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+        # Long-lived pool of threads downloading patent pages
+        self._executor = ThreadPoolExecutor(max_workers=detail_workers)
 
     def _select_search_options(self) -> None:
         """Select required search options."""
@@ -67,7 +224,11 @@ class FIPSParser:
             )
             self.driver_manager.click_element(header)
 
-        time.sleep(1)  # Wait for animation
+        # Wait for the section to expand instead of sleeping through the animation
+        try:
+            self._wait.until(EC.element_to_be_clickable(LOCATORS["dataset_checkbox"]))
+        except Exception as e:
+            logger.warning(f"Timeout waiting for section checkboxes: {e}")
 
         # Find checkboxes by their position in the container
         try:
@@ -84,6 +245,12 @@ class FIPSParser:
             self.driver_manager.click_element(checkbox4)
         except Exception as e:
             logger.error(f"Failed to find checkboxes: {e}")
+        else:
+            try:
+                self._wait.until(EC.element_selection_state_to_be(checkbox1, True))
+                self._wait.until(EC.element_selection_state_to_be(checkbox4, True))
+            except Exception as e:
+                logger.warning(f"Timeout waiting for checkboxes to be selected: {e}")
 
         # Find search button by value
         try:
@@ -100,28 +267,22 @@ class FIPSParser:
 
     def _set_status_filters(self) -> None:
         """Set status filters based on configuration."""
-        status_mapping = {
-            "status_active": self.status_options.active,
-            "status_may_terminate": self.status_options.may_terminate,
-            "status_terminated_recoverable": self.status_options.terminated_recoverable,
-            "status_terminated": self.status_options.terminated,
-        }
+        # Nothing to change when no status filter is requested
+        if self.status_options.is_default():
+            return
 
-        for status_key, should_be_checked in status_mapping.items():
-            try:
-                # Try to find checkbox by label text
-                element = self.driver_manager.find_checkbox_by_label(
-                    self.TEXT_LABELS[status_key]
-                )
-                is_checked = element.is_selected()
-
-                # Click only if current state doesn't match desired state
-                if is_checked != should_be_checked:
-                    self.driver_manager.click_element(element)
-                    time.sleep(0.5)
-
-            except Exception as e:
-                logger.error(f"Failed to set status checkbox: {e}")
+        try:
+            # Set all checkboxes in one call, clicking only mismatching ones
+            wanted = {
+                self.TEXT_LABELS[status_key]: getattr(self.status_options, option)
+                for status_key, option in self._STATUS_FIELDS
+            }
+            states = self.driver_manager.set_checkboxes(wanted)
+            for label, state in states.items():
+                if state is None:
+                    logger.error(f"Failed to find status checkbox: {label}")
+        except Exception as e:
+            logger.error(f"Failed to set status checkboxes: {e}")
 
     def _fill_search_form(self, query: str) -> None:
         """Fill and submit search form."""
@@ -136,18 +297,16 @@ class FIPSParser:
             logger.error(f"Failed to find patent owner: {e}")
             raise
 
-        # Clear the field and enter the query
-        search_input.clear()
-        search_input.send_keys(query)
+        # Replace the field value in one call; it is set synchronously
+        self.driver_manager.set_input_value(search_input, query)
         logger.info(f"Entered query into patent owner field: {query}")
-        time.sleep(0.5)
 
         self._set_status_filters()
 
         try:
             # Try to find search form submit button
             search_form_button = self.driver_manager.driver.find_element(
-                By.CSS_SELECTOR, "input[type='submit'][value='Поиск']"
+                *LOCATORS["search_form_button"]
             )
             self.driver_manager.click_element(search_form_button)
         except Exception as e:
@@ -156,315 +315,461 @@ class FIPSParser:
 
         logger.info("Search form submitted")
 
+    def _sync_http_session(self) -> None:
+        """Copy browser cookies and user agent into the HTTP session."""
+        driver = self.driver_manager.driver
+        self.http.headers["User-Agent"] = driver.execute_script(
+            "return navigator.userAgent"
+        )
+        for cookie in driver.get_cookies():
+            self.http.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
     def _get_patent_details(self, patent_id: str) -> Dict:
         """Get detailed information about a patent."""
         try:
-            # Open patent details in new tab
-            patent_url = f"{self.BASE_URL}document.xhtml?id={patent_id}"
-            self.driver_manager.open_url_in_new_tab(patent_url)
-
-            self.driver_manager.wait_for_element("StatusR")
-            self.driver_manager.wait_for_element("bib")
+            response = self.http.get(self._patent_url(patent_id), timeout=HTTP_TIMEOUT)
+            response.raise_for_status()
+
+            # Decode as UTF-8 unless the server names a charset explicitly
+            content_type = response.headers.get("Content-Type", "")
+            encoding = response.encoding if "charset" in content_type else "utf-8"
+            tree = lxml.html.fromstring(
+                response.content,
+                base_url=response.url,
+                parser=lxml.html.HTMLParser(encoding=encoding),
+            )
 
             # Extract information
-            details = self._extract_patent_details()
+            return self._extract_patent_details(tree)
 
-            # Close tab and return to main window
-            self.driver_manager.driver.close()
-            self.driver_manager.driver.switch_to.window(
-                self.driver_manager.driver.window_handles[0]
-            )
+        except Exception as e:
+            logger.warning(f"HTTP request for patent {patent_id} failed: {e}")
+            return {}
+
+    def _get_patent_details_in_browser(self, patent_id: str) -> Dict:
+        """Get patent details by opening its page in the detail browser tab."""
+        driver = self.driver_manager.driver
+        try:
+            # One detail tab is opened on first use and reused for later patents
+            if self._detail_handle is None:
+                driver.switch_to.new_window("tab")
+                self._detail_handle = driver.current_window_handle
+            else:
+                driver.switch_to.window(self._detail_handle)
 
-            return details
+            driver.get(self._patent_url(patent_id))
+            return self._read_open_patent_page()
 
         except Exception as e:
             logger.error(f"Error getting patent details for {patent_id}: {e}")
-            self._handle_failed_detail_extraction()
             return {}
-
-    def _extract_patent_header(self) -> PatentHeader:
-        """Extract patent header information from top right corner."""
-        try:
-            # Extract country code (RU)
-            country_code = self.driver_manager.driver.find_element(
-                By.ID, "top2"
-            ).text.strip()
-
-            # Extract patent number (2 820 873)
-            number_element = self.driver_manager.driver.find_element(
-                By.ID, "top4"
-            ).find_element(By.TAG_NAME, "a")
-            number = number_element.text.strip()
-            doc_url = number_element.get_attribute("href")
-
-            # Extract kind code (C1)
-            kind_code = self.driver_manager.driver.find_element(
-                By.ID, "top6"
-            ).text.strip()
-
-            # Extract IPC codes
-            ipc_codes = []
-            ipc_elements = self.driver_manager.driver.find_elements(
-                By.CSS_SELECTOR, "ul.ipc li a"
+        finally:
+            try:
+                driver.switch_to.window(self._main_handle)
+            except Exception as e:
+                logger.debug(f"Failed to switch to main window: {e}")
+
+    def _get_patents_details_in_tabs(
+        self, patents: List[PatentResult]
+    ) -> Iterator[Tuple[PatentResult, Dict]]:
+        """Get details of several patents from browser tabs loading together.
+
+        Args:
+            patents: Patents whose pages could not be fetched over HTTP
+
+        Yields:
+            Patent and its details (empty dict on failure)
+        """
+        driver = self.driver_manager.driver
+        for start in range(0, len(patents), BROWSER_TABS):
+            batch = patents[start : start + BROWSER_TABS]
+            # Pages of the whole batch load while earlier tabs are being read
+            handles = self.driver_manager.open_urls_in_tabs(
+                [self._patent_url(patent.link_id) for patent in batch]
             )
 
-            for element in ipc_elements:
-                # Extract both the IPC code and its date
-                ipc_text = element.find_element(By.CLASS_NAME, "i").text.strip()
-                date_text = element.text.split("(")[-1].strip(")")
-                ipc_codes.append(f"{ipc_text.strip()} ({date_text})")
-
-            return PatentHeader(
-                doc_url=doc_url,
-                country_code=country_code,
-                number=number,
-                kind_code=kind_code,
-                ipc_codes=ipc_codes,
-            )
-        except Exception as e:
-            logger.error(f"Error extracting patent header: {e}")
-            return PatentHeader("", "", "", [])
+            # Only tabs opened here are read and closed; details are keyed by
+            # the id in the page URL, so they never land under another patent
+            found = {}
+            for handle in handles:
+                try:
+                    driver.switch_to.window(handle)
+                    details = self._read_open_patent_page()
+                    found[self._patent_id_from_url(driver.current_url)] = details
+                except Exception as e:
+                    logger.error(f"Error getting patent details from a tab: {e}")
+                try:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                except Exception as e:
+                    logger.debug(f"Failed to close patent window: {e}")
+            driver.switch_to.window(self._main_handle)
+
+            for patent in batch:
+                if patent.link_id in found:
+                    yield patent, found[patent.link_id]
+                else:
+                    # No tab was opened or read for it, load it on its own
+                    yield patent, self._get_patent_details_in_browser(patent.link_id)
+
+    def _read_open_patent_page(self) -> Dict:
+        """Extract patent details from the page open in the current tab."""
+        driver = self.driver_manager.driver
+        self.driver_manager.wait_for_element(LOCATORS["bib"])
+        tree = lxml.html.fromstring(driver.page_source, base_url=driver.current_url)
+        return self._extract_patent_details(tree)
+
+    def _patent_url(self, patent_id: str) -> str:
+        """Get URL of the patent document page."""
+        return f"{self.BASE_URL}document.xhtml?id={patent_id}"
+
+    @staticmethod
+    def _patent_id_from_url(url: str) -> Optional[str]:
+        """Get patent id from URL of the patent document page."""
+        return parse_qs(urlsplit(url).query).get("id", [None])[0]
+
+    @staticmethod
+    def _rendered_text(element: lxml.html.HtmlElement) -> str:
+        """Get element text as the browser shows it.
+
+        Line breaks and block elements start new lines, and other whitespace
+        is collapsed, matching Selenium's element text.
+        """
+        # Source whitespace becomes spaces, only rendered breaks become "\n"
+        parts = []
+
+        def walk(node: lxml.html.HtmlElement) -> None:
+            if not isinstance(node.tag, str) or node.tag in ("script", "style"):
+                return
+            block = node.tag in BLOCK_TAGS
+            if node.tag == "br" or block:
+                parts.append("\n")
+            parts.append(WHITESPACE_PATTERN.sub(" ", node.text or ""))
+            for child in node:
+                walk(child)
+                parts.append(WHITESPACE_PATTERN.sub(" ", child.tail or ""))
+            if block:
+                parts.append("\n")
+
+        walk(element)
+        lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+        return "\n".join(line for line in lines if line)
+
+    @classmethod
+    def _xpath_text(
+        cls, node: lxml.html.HtmlElement, xpath: etree.XPath
+    ) -> Optional[str]:
+        """Get rendered text of the first node matching xpath, if any."""
+        found = xpath(node)
+        return cls._rendered_text(found[0]) if found else None
+
+    def _read_patent_page(self, tree: lxml.html.HtmlElement) -> Dict:
+        """Read raw field values from a parsed patent page."""
+        bib = DOCUMENT_XPATHS["bib"](tree)
+        if not bib:
+            raise ValueError("bibliography section not found")
+
+        link = DOCUMENT_XPATHS["number_link"](tree)
+        href = link[0].get("href") if link else None
+
+        ipc = []
+        for element in DOCUMENT_XPATHS["ipc_links"](tree):
+            match = IPC_PATTERN.match(element.text_content())
+            if match:
+                code = " ".join(match["code"].split())
+                ipc.append({"code": code, "date": match["date"]})
+
+        return {
+            "name_doc": self._xpath_text(tree, DOCUMENT_XPATHS["name_doc"]),
+            "status": [
+                self._rendered_text(element)
+                for element in DOCUMENT_XPATHS["status"](tree)
+            ],
+            "country_code": self._xpath_text(tree, DOCUMENT_XPATHS["country_code"]),
+            "number": self._rendered_text(link[0]) if link else None,
+            "doc_url": urljoin(link[0].base_url or "", href) if href else None,
+            "kind_code": self._xpath_text(tree, DOCUMENT_XPATHS["kind_code"]),
+            "ipc": ipc,
+            "spk": self._xpath_text(tree, DOCUMENT_XPATHS["spk"]),
+            # Walk paragraphs inside the already located bibliography table
+            "paragraphs": [paragraph.text_content() for paragraph in bib[0].iter("p")],
+            "b542": self._xpath_text(tree, DOCUMENT_XPATHS["title"]),
+        }
+
+    def _extract_patent_header(self, page: Dict) -> PatentHeader:
+        """Extract patent header information from top right corner."""
+        if not page["number"]:
+            logger.error("Error extracting patent header: number not found")
+
+        # Combine each IPC code with its date
+        ipc_codes = tuple(f"{ipc['code']} ({ipc['date']})" for ipc in page["ipc"])
+
+        return PatentHeader(
+            doc_url=page["doc_url"] or "",
+            country_code=page["country_code"] or "",
+            number=page["number"] or "",
+            kind_code=page["kind_code"] or "",
+            ipc_codes=ipc_codes,
+        )
 
-    def _extract_patent_details(self) -> Dict:
-        """Extract all available patent details from the current page."""
+    def _extract_patent_details(self, tree: lxml.html.HtmlElement) -> Dict:
+        """Extract all available patent details from a parsed patent page."""
+        page = self._read_patent_page(tree)
 
         # Get document name from NameDoc element
-        try:
-            name_doc_element = self.driver_manager.driver.find_element(By.ID, "NameDoc")
-            doc_name = name_doc_element.find_element(By.TAG_NAME, "b").text.strip()
-        except Exception as e:
-            logger.warning(f"Error extracting document name: {e}")
+        doc_name = page["name_doc"]
+        if not doc_name:
+            logger.warning("Error extracting document name: NameDoc not found")
             doc_name = "ОПИСАНИЕ ???"  # fallback value
 
+        statuses = page["status"]
         details = {
             doc_name: "",
-            "Статус": self._get_status_text(),
-            "Пошлина": self._get_fee_text(),
+            "Статус": statuses[0] if statuses else "",
+            "Пошлина": statuses[1] if len(statuses) > 1 else "",
         }
 
         # Extract header information
-        header = self._extract_patent_header()
+        header = self._extract_patent_header(page)
         details["Ссылка"] = header.doc_url
         details["Документ"] = (
             f"{header.country_code} (11) {header.number} (13) {header.kind_code}"
         )
         if header.ipc_codes:
             details["МПК"] = "\n".join(header.ipc_codes)
-        try:
-            spk_div = self.driver_manager.driver.find_element(By.CLASS_NAME, "spk")
-            details["СПК"] = spk_div.text.strip()
-        except Exception as e:
-            logger.debug(f"Failed to find SPK element: {e}")
-            pass
+        if page["spk"]:
+            details["СПК"] = page["spk"]
 
         # Process all paragraphs
-        bib_table = self.driver_manager.driver.find_element(By.ID, "bib")
-        for paragraph in bib_table.find_elements(By.TAG_NAME, "p"):
-            self._process_paragraph(paragraph, details)
+        for text in page["paragraphs"]:
+            self._process_paragraph(text, details)
 
-        # Extract invention title from B542
-        try:
-            b542_element = self.driver_manager.driver.find_element(By.ID, "B542")
-            title_text = b542_element.text.strip()
-            # Extract text between (54) and the actual title
-            if "(54)" in title_text:
-                details["(54) Название"] = title_text.split("(54)")[1].strip()
-        except Exception as e:
-            logger.warning(f"Error extracting B542 title: {e}")
+        # Extract invention title from B542, following its (54) marker
+        match = TITLE_PATTERN.search(page["b542"] or "")
+        if match:
+            details["(54) Название"] = match["title"].strip()
 
         return details
 
-    def _get_status_text(self) -> str:
-        """Get patent status text."""
-        elements = self.driver_manager.driver.find_elements(By.ID, "StatusR")
-        return elements[0].text if elements else ""
-
-    def _get_fee_text(self) -> str:
-        """Get patent fee text."""
-        elements = self.driver_manager.driver.find_elements(By.ID, "StatusR")
-        return elements[1].text if len(elements) > 1 else ""
-
-    def _process_paragraph(self, paragraph: WebElement, details: Dict) -> None:
+    def _process_paragraph(self, text: str, details: Dict) -> None:
         """Process a single paragraph and add its content to details."""
-        try:
-            text = paragraph.get_attribute("textContent").strip()
-            if text:
-                parts = text.split(":", 1)
-                if len(parts) > 1:
-                    details[parts[0].strip()] = parts[1].strip()
-                else:
-                    details[text] = ""
-        except Exception as e:
-            logger.warning(f"Error processing paragraph: {e}")
-
-    def _handle_failed_detail_extraction(self) -> None:
-        """Handle cleanup after failed detail extraction."""
-        try:
-            self.driver_manager.driver.close()
-            self.driver_manager.driver.switch_to.window(
-                self.driver_manager.driver.window_handles[0]
-            )
-        except Exception as e:
-            logger.debug(f"Failed to close window or switch to main window: {e}")
-            pass
+        text = text.strip()
+        if text:
+            parts = text.split(":", 1)
+            if len(parts) > 1:
+                details[parts[0].strip()] = parts[1].strip()
+            else:
+                details[text] = ""
 
     def _parse_search_results(self, page_number: int) -> List[PatentResult]:
         """Parse patents from current search results page."""
         results = []
+        self._no_results = False
 
         # Use explicit wait instead of sleep
         try:
-            # Wait for search results to appear with explicit timeout
-            WebDriverWait(self.driver_manager.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "a.tr"))
-            )
+            # Wait for result rows or the marker of an empty search result
+            self._wait.until(self._results_ready)
         except Exception as e:
             logger.warning(f"Timeout waiting for search results: {e}")
             return results
 
-        # Find all patent elements
-        elements = self.driver_manager.driver.find_elements(By.CSS_SELECTOR, "a.tr")
-        if not elements:
-            logger.warning("No patent elements found on page")
+        # Read all result rows in a single round-trip to the browser
+        rows = self.driver_manager.driver.execute_script(
+            self.JS_RESULT_ROWS, JS_SELECTORS
+        )
+        if not rows:
+            # An explicit empty result is final, so the page is not retried
+            driver = self.driver_manager.driver
+            self._no_results = bool(driver.find_elements(*LOCATORS["no_results"]))
+            if not self._no_results:
+                logger.warning("No patent elements found on page")
             return results
 
         if self.test_mode:
-            elements = elements[:5]
-            logger.info(f"Test mode: limiting to {len(elements)} patents")
+            rows = rows[:5]
+            logger.info(f"Test mode: limiting to {len(rows)} patents")
+
+        for row in rows:
+            patent = self._parse_patent_row(row)
+            if patent:
+                results.append(patent)
+
+        # Handle each id once, skipping patents whose details were already saved
+        unique: List[PatentResult] = []
+        saved: Dict[str, bool] = {}
+        pending: List[PatentResult] = []
+        for patent in results:
+            if patent.link_id in saved:
+                continue
+            unique.append(patent)
+            saved[patent.link_id] = self.storage.restore_patent_details(patent.number)
+            if not saved[patent.link_id]:
+                pending.append(patent)
 
-        # Process each patent element
-        for element in elements:
+        # Fetch details concurrently, keeping file writes on this thread
+        for patent, details in self._fetch_details_batch(pending):
             try:
-                patent = self._parse_patent_element(element)
-                if patent:
-                    results.append(patent)
-
-                    # Get and save patent details
-                    details = self._get_patent_details(patent.link_id)
-                    if details:
-                        self.storage.save_patent_details(patent.number, details)
-                        self.storage.save_patent_to_csv(patent)
-                        logger.info(f"Processed patent {patent.number}")
-                    else:
-                        logger.warning(
-                            f"Failed to get details for patent {patent.number}"
-                        )
+                if details:
+                    self.storage.save_patent_details(patent.number, details)
+                    saved[patent.link_id] = True
+                    logger.debug(f"Processed patent {patent.number}")
+                else:
+                    logger.warning(f"Failed to get details for patent {patent.number}")
             except Exception as e:
-                logger.warning(f"Error parsing patent element: {e}")
-                continue
+                logger.warning(f"Error processing patent {patent.number}: {e}")
+
+        # Write CSV rows in search result order, whatever order details came in
+        processed = 0
+        for patent in unique:
+            if saved[patent.link_id]:
+                self.storage.save_patent_to_csv(patent)
+                processed += 1
 
+        logger.info(f"Page {page_number}: processed {processed} patents")
         return results
 
-    def _parse_patent_element(self, element: WebElement) -> Optional[PatentResult]:
-        """Parse single patent element from search results."""
-        try:
-            link_id = element.get_attribute("id")
-            columns = element.find_elements(By.CSS_SELECTOR, "div.td")
-
-            img_element = element.find_elements(By.TAG_NAME, "img")
-            img_url = img_element[0].get_attribute("src") if img_element else None
-
-            return PatentResult(
-                number=columns[1].text.strip(),
-                publication_date=columns[2].text.strip("()"),
-                title=columns[4].text.strip(),
-                document_type=columns[5].text.strip(),
-                link_id=link_id,
-                image_url=img_url,
-            )
-        except Exception as e:
-            logger.warning(f"Error creating PatentResult: {e}")
+    def _fetch_details_batch(
+        self, patents: List[PatentResult]
+    ) -> Iterator[Tuple[PatentResult, Dict]]:
+        """Fetch details of all patents at once, yielding them as they arrive.
+
+        Args:
+            patents: Patents whose detail pages should be downloaded
+
+        Yields:
+            Patent and its details (empty dict on failure)
+        """
+        futures = {
+            self._executor.submit(self._get_patent_details, patent.link_id): patent
+            for patent in patents
+        }
+        failed = []
+        for future in as_completed(futures):
+            patent, details = futures[future], future.result()
+            if details:
+                yield patent, details
+            else:
+                failed.append(patent)
+
+        # Fall back to the browser, which runs on this thread only
+        if len(failed) == 1:
+            yield failed[0], self._get_patent_details_in_browser(failed[0].link_id)
+        elif failed:
+            yield from self._get_patents_details_in_tabs(failed)
+
+    def _parse_patent_row(self, row: Dict) -> Optional[PatentResult]:
+        """Parse single patent row read from search results."""
+        if row["n"] is None or row["dt"] is None:
+            logger.warning(f"Error creating PatentResult: incomplete row {row['id']}")
             return None
 
-    def collect_all_results(self) -> List[PatentResult]:
-        """Collect all patent results across pages."""
-        page = 1
-        all_results = []
-        max_retries = 3
+        return PatentResult(
+            number=row["n"],
+            publication_date=row["d"],
+            title=row["t"],
+            document_type=row["dt"],
+            link_id=row["id"],
+            image_url=row["img"],
+        )
 
-        while True:
-            logger.info(f"Processing page {page}")
+    def collect_all_results(self) -> Iterator[PatentResult]:
+        """Collect all patent results across pages, yielding them page by page.
 
-            # Try to parse results with retries
-            retry_count = 0
-            results = []
+        Can be iterated directly once the search form has been submitted.
+        """
+        # Detail pages are fetched with the browser session of the search
+        self._main_handle = self.driver_manager.driver.current_window_handle
+        self._sync_http_session()
 
-            while retry_count < max_retries and not results:
-                try:
-                    results = self._parse_search_results(page)
-                    if not results and retry_count < max_retries - 1:
-                        logger.warning(f"No results found on page {page}, retrying...")
-                        time.sleep(1)
-                except Exception as e:
-                    logger.error(f"Error parsing page {page}: {e}")
-                    if retry_count < max_retries - 1:
-                        logger.info(f"Retrying page {page}...")
-                        time.sleep(1)
+        page = 1
+        total = 0
+        max_retries = 3
 
-                retry_count += 1
+        # Keep the CSV file open while pages are processed
+        with self.storage.open_csv():
+            while True:
+                logger.info(f"Processing page {page}")
+
+                # Try to parse results with retries
+                retry_count = 0
+                results = []
+
+                while retry_count < max_retries and not results:
+                    try:
+                        results = self._parse_search_results(page)
+                        if self._no_results:
+                            break
+                        if not results and retry_count < max_retries - 1:
+                            # The next attempt waits for the result rows itself
+                            logger.warning(
+                                f"No results found on page {page}, retrying..."
+                            )
+                    except Exception as e:
+                        logger.error(f"Error parsing page {page}: {e}")
+                        if retry_count < max_retries - 1:
+                            logger.info(f"Retrying page {page}...")
+
+                    retry_count += 1
+
+                # Add results to collection
+                if results:
+                    total += len(results)
+                    yield from results
+                    logger.info(f"Found {len(results)} results on page {page}")
+                elif self._no_results:
+                    logger.info(f"Search returned no results on page {page}")
+                    break
+                else:
+                    logger.warning(
+                        f"No results found on page {page} after {max_retries} attempts"
+                    )
 
-            # Add results to collection
-            if results:
-                all_results.extend(results)
-                logger.info(f"Found {len(results)} results on page {page}")
-            else:
-                logger.warning(
-                    f"No results found on page {page} after {max_retries} attempts"
-                )
+                # Exit conditions
+                if self.test_mode and page >= 3:
+                    logger.info("Test mode: stopping after 3 pages")
+                    break
 
-            # Exit conditions
-            if self.test_mode and page >= 3:
-                logger.info("Test mode: stopping after 3 pages")
-                break
+                # Try to go to next page
+                if not self._go_to_next_page():
+                    logger.info("No more pages available")
+                    break
 
-            # Try to go to next page
-            if not self._go_to_next_page():
-                logger.info("No more pages available")
-                break
+                page += 1
 
-            page += 1
+        logger.info(f"Total results collected: {total}")
 
-        logger.info(f"Total results collected: {len(all_results)}")
-        return all_results
+    def _find_next_button_if_enabled(self) -> Optional[WebElement]:
+        """Find the next page button in one call, None if absent or disabled."""
+        return self.driver_manager.driver.execute_script(
+            self.JS_NEXT_BUTTON, JS_SELECTORS
+        )
 
     def _go_to_next_page(self) -> bool:
         """Navigate to next page if available."""
-
-        try:
-            next_button = self.driver_manager.driver.find_element(
-                By.CSS_SELECTOR, "a.ui-commandlink.ui-widget.modern-page-next"
-            )
-
-            # Check if button is disabled
-            disabled = "ui-state-disabled" in next_button.get_attribute(
-                "class"
-            ) or "disabled" in next_button.get_attribute("class")
-
-            # Also check if onclick attribute is empty or None
-            onclick = next_button.get_attribute("onclick")
-            if disabled or not onclick or onclick == "return false;":
-                return False
-        except Exception:
-            logger.info("No next page button found")
+        next_button = self._find_next_button_if_enabled()
+        if next_button is None:
+            logger.info("No enabled next page button found")
             return False
 
+        # Remember the current first row to detect when it gets replaced
+        old_rows = self.driver_manager.driver.find_elements(*LOCATORS["result_row"])
+
         self.driver_manager.click_element(next_button)
 
-        # Wait for specific elements to indicate page has loaded
+        # Wait for the old results to be replaced by the next page rows
         try:
-            # Wait for results to load (more specific than generic page load)
-            WebDriverWait(self.driver_manager.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, ".search-result-item"))
-            )
-        except Exception:
-            # Fallback to generic page load wait
-            logger.warning(
-                "Failed to wait for results to load, falling back to page load"
-            )
-            self.driver_manager.wait_for_page_load()
+            if old_rows:
+                self._wait.until(EC.staleness_of(old_rows[0]))
+            self._wait.until(self._rows_present)
+        except Exception as e:
+            logger.warning(f"Timeout waiting for next page results: {e}")
 
-        # Short pause to ensure page is fully interactive
-        time.sleep(0.5)
         return True
 
     def start_search(
@@ -478,13 +783,13 @@ class FIPSParser:
         try:
             logger.info("Opening FIPS page")
             self.driver_manager.driver.get(self.BASE_URL)
-            self.driver_manager.wait_for_page_load()
 
+            # Each step waits for the exact element it needs next: the
+            # section header, the patent owner input and the result rows
             self._select_search_options()
             self._fill_search_form(query)
-            self.driver_manager.wait_for_page_load()
 
-            results = self.collect_all_results()
+            results = list(self.collect_all_results())
 
             logger.info("Search completed successfully")
             logger.info(f"Detailed information saved to: {self.storage.patents_dir}")
@@ -497,6 +802,20 @@ class FIPSParser:
 
     def close(self) -> None:
         """Clean up resources."""
-        if self.driver_manager.driver:
-            self.driver_manager.driver.quit()
-            logger.info("Browser closed")
+        self._executor.shutdown(cancel_futures=True)
+        self.storage.close()
+        self.http.close()
+        if self._detail_handle is not None:
+            driver = self.driver_manager.driver
+            try:
+                driver.switch_to.window(self._detail_handle)
+                driver.close()
+            except Exception as e:
+                logger.debug(f"Failed to close detail window: {e}")
+            try:
+                driver.switch_to.window(self._main_handle)
+            except Exception as e:
+                logger.debug(f"Failed to switch to main window: {e}")
+        # The browser stays running for the next parser in this process
+        self.driver_manager.release()
+        logger.info("Browser released")
@@ -0,0 +1,162 @@
+import json
+import os
+import socket
+import socketserver
+import sys
+from dataclasses import fields
+from pathlib import Path
+from typing import Dict, Optional
+
+from .browser_pool import read_endpoint, runtime_dir
+from .logger import logger
+from .models import StatusOptions
+from .parser import FIPSParser
+
+# Socket the long-lived service listens on, kept in runtime_dir()
+SOCKET_NAME = "fips-service.sock"
+
+# Seconds a client may take to send its request line
+REQUEST_TIMEOUT = 10
+
+# Accepted request keys and their types
+REQUEST_FIELDS = {
+    "base_dir": str,
+    "status_options": dict,
+    "test_mode": bool,
+    "query": str,
+    "reuse_saved_details": bool,
+}
+
+
+def _validate_request(request: Dict) -> None:
+    """Reject requests with unknown keys or values of unexpected types."""
+    if not isinstance(request, dict):
+        raise ValueError("Request must be a JSON object")
+    for key, value in request.items():
+        if key not in REQUEST_FIELDS:
+            raise ValueError(f"Unknown request field: {key}")
+        if not isinstance(value, REQUEST_FIELDS[key]):
+            raise ValueError(f"Invalid value of request field: {key}")
+
+    status_fields = {field.name for field in fields(StatusOptions)}
+    for key, value in request.get("status_options", {}).items():
+        if key not in status_fields or not isinstance(value, bool):
+            raise ValueError(f"Invalid status option: {key}")
+
+    if "base_dir" in request and not Path(request["base_dir"]).is_dir():
+        raise ValueError(f"Base directory does not exist: {request['base_dir']}")
+
+
+def run_search(request: Dict) -> Dict:
+    """Run one search; the browser stays pooled for the next request.
+
+    Args:
+        request: Search parameters: base_dir, status_options, test_mode, query,
+            reuse_saved_details
+
+    Returns:
+        Number of results and paths of the saved files
+    """
+    _validate_request(request)
+    # Attach to the shared browser if one was started with fips.browser_pool
+    parser = FIPSParser(
+        base_dir=Path(request.get("base_dir") or Path.cwd()),
+        status_options=StatusOptions(**request.get("status_options", {})),
+        test_mode=request.get("test_mode", False),
+        cdp_endpoint=read_endpoint(),
+        reuse_saved_details=request.get("reuse_saved_details", False),
+    )
+    try:
+        if request.get("query"):
+            results = parser.start_search(query=request["query"])
+        else:
+            results = parser.start_search()
+        return {
+            "results": len(results),
+            "csv_path": str(parser.storage.csv_path),
+            "patents_dir": str(parser.storage.patents_dir),
+        }
+    finally:
+        parser.close()
+
+
+def _handle_line(line: bytes) -> bytes:
+    """Run search from a JSON line and encode the response as a JSON line."""
+    try:
+        response = run_search(json.loads(line))
+    except Exception as e:
+        logger.error(f"Search request failed: {e}")
+        response = {"error": str(e)}
+    return json.dumps(response, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+class _SearchHandler(socketserver.StreamRequestHandler):
+    """Serves one JSON line request per connection."""
+
+    # A client that never finishes its request must not block the service
+    timeout = REQUEST_TIMEOUT
+
+    def handle(self) -> None:
+        try:
+            line = self.rfile.readline()
+        except OSError as e:
+            logger.warning(f"Failed to read search request: {e}")
+            return
+        self.wfile.write(_handle_line(line))
+
+
+def serve(socket_path: Optional[Path] = None) -> None:
+    """Serve search requests on a Unix socket until interrupted."""
+    socket_path = socket_path or runtime_dir() / SOCKET_NAME
+    socket_path.unlink(missing_ok=True)
+    with socketserver.UnixStreamServer(str(socket_path), _SearchHandler) as server:
+        # Only the owner may submit searches that write files in its name
+        os.chmod(socket_path, 0o600)
+        logger.info(f"Search service listening on {socket_path}")
+        try:
+            server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def serve_stdin() -> None:
+    """Serve search requests read as JSON lines from stdin."""
+    for line in sys.stdin.buffer:
+        if line.strip():
+            sys.stdout.buffer.write(_handle_line(line))
+            sys.stdout.flush()
+
+
+def request_search(request: Dict, socket_path: Optional[Path] = None) -> Optional[Dict]:
+    """Send search to the running service.
+
+    Args:
+        request: Search parameters, see run_search()
+        socket_path: Socket of the service, in runtime_dir() by default
+
+    Returns:
+        Service response, or None if no service is running
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(socket_path or runtime_dir() / SOCKET_NAME))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock:
+        sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+        response = json.loads(sock.makefile("rb").readline())
+
+    if "error" in response:
+        raise RuntimeError(f"Search service failed: {response['error']}")
+    return response
+
+
+if __name__ == "__main__":
+    if "--stdin" in sys.argv[1:]:
+        serve_stdin()
+    else:
+        serve()
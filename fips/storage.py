@@ -1,24 +1,50 @@
 import csv
-from dataclasses import asdict
+import shutil
+from contextlib import contextmanager
+from dataclasses import asdict, fields
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
 
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment
+from openpyxl.utils import get_column_letter
 
 from .logger import logger
 from .models import PatentResult
 
+# Number of CSV rows written between flushes to disk
+CSV_FLUSH_ROWS = 100
+
+# CSV column names, in PatentResult field order
+CSV_FIELDS = tuple(field.name for field in fields(PatentResult))
+
+# Detail fields placed at the top of the XLSX sheet, in this order
+XLSX_PRIORITY_FIELDS = ("Ссылка", "Документ", "МПК")
+
+# Alignment of every text cell in patent detail sheets
+WRAP_ALIGNMENT = Alignment(wrap_text=True, vertical="top")
+
 
 class PatentStorage:
     """Handles storage operations for patent data."""
 
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, reuse_saved_details: bool = False):
         self.base_dir = base_dir
         patents_basename = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.csv_path = base_dir / f"{patents_basename}.csv"
         self.patents_dir = base_dir / patents_basename
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._csv_pending_rows = 0
+        # Detail files saved by previous runs, latest run winning; their
+        # status and fee may be outdated, so they are reused only on request
+        self._saved_details = (
+            {path.stem: path for path in sorted(base_dir.glob("*/*.xlsx"))}
+            if reuse_saved_details
+            else {}
+        )
         self._setup_storage()
 
     def _setup_storage(self) -> None:
@@ -29,117 +55,162 @@ class PatentStorage:
 
     def _initialize_csv(self) -> None:
         """Create CSV file with headers."""
-        headers = asdict(PatentResult("", "", "", "", "")).keys()
         with open(self.csv_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
             writer.writeheader()
 
+    def open_csv_writer(self) -> csv.DictWriter:
+        """Open CSV file once and keep a buffered writer until close()."""
+        if self._csv_writer is None:
+            self._csv_file = open(
+                self.csv_path, "a", newline="", encoding="utf-8", buffering=1 << 16
+            )
+            self._csv_writer = csv.DictWriter(self._csv_file, fieldnames=CSV_FIELDS)
+        return self._csv_writer
+
+    @contextmanager
+    def open_csv(self) -> Iterator[csv.DictWriter]:
+        """Keep the CSV file open for a batch of writes, closing it afterwards."""
+        try:
+            yield self.open_csv_writer()
+        finally:
+            self.close()
+
     def save_patent_to_csv(self, patent: PatentResult) -> None:
         """Save patent data to CSV."""
-        with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=asdict(patent).keys())
-            writer.writerow(asdict(patent))
+        self.open_csv_writer().writerow(asdict(patent))
+        self._csv_pending_rows += 1
+        if self._csv_pending_rows >= CSV_FLUSH_ROWS:
+            self._csv_file.flush()
+            self._csv_pending_rows = 0
+
+    def close(self) -> None:
+        """Flush and close the CSV file."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+            self._csv_pending_rows = 0
+
+    def details_path(self, patent_number: str) -> Path:
+        """Get path of the XLSX file with patent details for this run."""
+        return self.patents_dir / f"{patent_number}.xlsx"
+
+    def restore_patent_details(self, patent_number: str) -> bool:
+        """Reuse patent details already saved in this or a previous run.
+
+        Previous runs are searched only with reuse_saved_details enabled.
+
+        Args:
+            patent_number: Number of the patent
+
+        Returns:
+            True if details file is present in this run's directory
+        """
+        file_path = self.details_path(patent_number)
+        if file_path.exists():
+            return True
+
+        saved_path = self._saved_details.get(patent_number)
+        if saved_path is None:
+            return False
+
+        shutil.copy2(saved_path, file_path)
+        logger.debug(f"Reused XLSX file: {saved_path}")
+        return True
 
     def save_patent_details(self, patent_number: str, details: Dict) -> None:
         """Save detailed patent information to XLSX with specific field ordering."""
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Информация о патенте"
-
-        # Priority fields to be placed at the top
-        priority_fields = ["Ссылка", "Документ", "МПК"]
+        rows = list(self._ordered_fields(details))
 
-        # Start with priority fields
-        current_row = 1
-        for field in priority_fields:
-            if field in details:
-                name_cell = ws.cell(row=current_row, column=1, value=field)
-                name_cell.alignment = Alignment(wrap_text=True, vertical="top")
+        # Write-only sheets need dimensions set before rows are streamed
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Информация о патенте")
 
-                if field == "Ссылка":
-                    cell = ws.cell(row=current_row, column=2, value=details[field])
-                    cell.hyperlink = details[field]
-                    cell.style = "Hyperlink"
-                else:
-                    cell = ws.cell(row=current_row, column=2, value=details[field])
-                    cell.alignment = Alignment(wrap_text=True, vertical="top")
+        widths, heights = self._sheet_dimensions(rows)
+        for column, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(column)].width = width
+        for row, height in heights.items():
+            ws.row_dimensions[row].height = height
 
-                current_row += 1
-                del details[field]
+        for key, value in rows:
+            ws.append([self._text_cell(ws, key), self._value_cell(ws, key, value)])
 
-        # Add remaining fields
-        for key, value in details.items():
-            name_cell = ws.cell(row=current_row, column=1, value=key)
-            name_cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-            if value:
-                value_cell = ws.cell(row=current_row, column=2, value=value)
-                value_cell.alignment = Alignment(wrap_text=True, vertical="top")
-
-            current_row += 1
+        file_path = self.details_path(patent_number)
+        wb.save(file_path)
+        logger.debug(f"Saved XLSX file: {file_path}")
 
-        self._adjust_column_widths(ws)
-        self._adjust_row_heights(ws)
+    @staticmethod
+    def _ordered_fields(details: Dict) -> Iterator[Tuple[str, Optional[str]]]:
+        """Yield priority fields first, then the rest without empty values."""
+        for field in XLSX_PRIORITY_FIELDS:
+            if field in details:
+                yield field, details[field]
 
-        file_path = self.patents_dir / f"{patent_number}.xlsx"
-        wb.save(file_path)
-        logger.info(f"Saved XLSX file: {file_path}")
+        for key, value in details.items():
+            if key not in XLSX_PRIORITY_FIELDS:
+                yield key, value if value else None
 
     @staticmethod
-    def _adjust_column_widths(worksheet) -> None:
-        """Adjust column widths based on content."""
-        for column in worksheet.columns:
-            max_length = max(len(str(cell.value or "")) for cell in column)
-            # Limit maximum width to 100 characters to prevent too wide columns
-            adjusted_width = min(max_length + 2, 100)
-            worksheet.column_dimensions[
-                openpyxl.utils.get_column_letter(column[0].column)
-            ].width = adjusted_width
+    def _text_cell(worksheet, value: Optional[str]) -> WriteOnlyCell:
+        """Create cell with wrapped top-aligned text."""
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.alignment = WRAP_ALIGNMENT
+        return cell
+
+    def _value_cell(
+        self, worksheet, key: str, value: Optional[str]
+    ) -> Optional[WriteOnlyCell]:
+        """Create cell for a field value, linking the document URL."""
+        if key != "Ссылка":
+            return self._text_cell(worksheet, value) if value is not None else None
+
+        cell = WriteOnlyCell(worksheet, value=value)
+        cell.hyperlink = value
+        cell.style = "Hyperlink"
+        return cell
 
     @staticmethod
-    def _adjust_row_heights(worksheet) -> None:
-        """Adjust row heights to fit multiline content."""
+    def _sheet_dimensions(
+        rows: List[Tuple[str, Optional[str]]],
+    ) -> Tuple[List[int], Dict[int, float]]:
+        """Calculate column widths and multiline row heights in one pass."""
         DEFAULT_ROW_HEIGHT = 15  # Standard Excel row height
         MIN_HEIGHT_PADDING = 5  # Additional padding for each row
         CHAR_HEIGHT_FACTOR = 1.2  # Factor to account for character height variations
 
-        for row in worksheet.rows:
-            max_lines = 1
-
-            for cell in row:
-                if not cell.value:  # Skip empty cells
-                    continue
-
-                cell_text = str(cell.value)
-
-                # 1. Count explicit line breaks
-                explicit_lines = cell_text.count("\n") + 1
-
-                # 2. Calculate wrapped lines based on column width
-                column_width = worksheet.column_dimensions[
-                    openpyxl.utils.get_column_letter(cell.column)
-                ].width
-
-                # Average chars that fit in column (assuming default font)
-                chars_per_line = max(1, int(column_width * 1.8))
-
-                # Calculate wrapped lines
-                text_length = len(cell_text)
-                wrapped_lines = -(-text_length // chars_per_line)  # Ceiling division
-
-                # Take maximum of explicit and wrapped lines
-                total_lines = max(explicit_lines, wrapped_lines)
-
-                # Update max_lines if this cell needs more
-                max_lines = max(max_lines, total_lines)
+        # Measure every cell once: text length and explicit line count
+        max_lengths = [0, 0]
+        measured = []
+        for row in rows:
+            cells = []
+            for column, value in enumerate(row):
+                cell_text = str(value) if value else ""
+                max_lengths[column] = max(max_lengths[column], len(cell_text))
+                if cell_text:  # Skip empty cells
+                    cells.append((column, len(cell_text), cell_text.count("\n") + 1))
+            measured.append(cells)
+
+        # Limit maximum width to 100 characters to prevent too wide columns
+        widths = [min(length + 2, 100) for length in max_lengths]
+        # Average chars that fit in column (assuming default font)
+        chars_per_line = [max(1, int(width * 1.8)) for width in widths]
+
+        heights = {}
+        for row_number, cells in enumerate(measured, 1):
+            # Take maximum of explicit and wrapped lines over the row
+            max_lines = max(
+                (
+                    max(explicit_lines, -(-text_length // chars_per_line[column]))
+                    for column, text_length, explicit_lines in cells
+                ),
+                default=1,
+            )
 
             # Calculate final row height with padding
             if max_lines > 1:
-                # Base height calculation
                 base_height = max_lines * DEFAULT_ROW_HEIGHT
-
-                # Add padding and adjust by factor
-                final_height = (base_height * CHAR_HEIGHT_FACTOR) + MIN_HEIGHT_PADDING
-
-                # Set the row height
-                worksheet.row_dimensions[row[0].row].height = final_height
+                heights[row_number] = (
+                    base_height * CHAR_HEIGHT_FACTOR
+                ) + MIN_HEIGHT_PADDING
+        return widths, heights
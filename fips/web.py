@@ -1,32 +1,428 @@
-import time
+import atexit
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
 from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from .logger import logger
+
+# Environment variable with the endpoint of a running browser to attach to
+CDP_ENDPOINT_ENV = "FIPS_CDP_ENDPOINT"
+
+# Environment variable with the Chrome executable, e.g. chrome-headless-shell
+CHROME_BINARY_ENV = "FIPS_CHROME_BINARY"
+
+# Environment variable that shows the browser window when set to "0"
+HEADLESS_ENV = "FIPS_HEADLESS"
+
+# Flags for batch scraping without a display: no background work or
+# features the scraper never uses
+HEADLESS_ARGS = (
+    "--headless=new",
+    "--disable-background-networking",
+    "--disable-background-timer-throttling",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,BackForwardCache,MediaRouter",
+    "--mute-audio",
+    "--no-first-run",
+    "--no-default-browser-check",
+)
+
+# Content settings of the browser, as passed to ChromeOptions prefs
+CONTENT_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.managed_default_content_settings.stylesheets": 2,
+    "profile.managed_default_content_settings.fonts": 2,
+    "profile.default_content_setting_values.notifications": 2,
+}
+
+# Connections kept open to the driver for concurrent commands
+COMMAND_POOL_SIZE = 16
+
+# True once the document is loaded and jQuery, if present, has no active requests
+JS_PAGE_READY = (
+    "return document.readyState === 'complete'"
+    " && (typeof jQuery === 'undefined' || jQuery.active === 0);"
+)
+
+# Relative path from a form field name block to the input next to it
+INPUT_AFTER_NAME_XPATH = "./following-sibling::div[contains(@class, 'input')]//input"
+
+# Script helper locating the checkbox that precedes a label with given text
+JS_FIND_CHECKBOX_BY_LABEL = """
+    const findCheckbox = (text) => {
+        const label = [...document.querySelectorAll('label')].find(
+            (l) => l.textContent.replace(/\\s+/g, ' ').trim() === text
+        );
+        let input = label ? label.previousElementSibling : null;
+        while (input && !(input.tagName === 'INPUT' && input.type === 'checkbox')) {
+            input = input.previousElementSibling;
+        }
+        return input;
+    };
+"""
+
+# Locator templates, formatted with quoted XPath and CSS literals by the builders below
+XPATH_TEXT = "(//{0}[contains(text(), {1})])[1]"
+XPATH_BUTTON_VALUE = "//input[@type='submit' and contains(@value, {0})]"
+XPATH_CLASS_TEXT = "//*[contains(@class, {0}) and contains(text(), {1})]"
+XPATH_NAME_BLOCK = (
+    "//div[contains(@class, 'oneblock')]"
+    "//div[contains(@class, 'name')][contains(., {0})]"
+)
+XPATH_CHECKBOX_POSITION = (
+    "(//input[@type='checkbox'][ancestor::*[contains(@class, {0})]])[{1}]"
+)
+CSS_CONTAINER_BUTTON = "[class*={0}] input[type={1}]"
+
+
+@lru_cache(maxsize=4096)
+def _xpath_literal(text: str) -> str:
+    """Quote text as an XPath string literal, even if it contains quotes."""
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    return "concat(" + ', "\'", '.join(f"'{part}'" for part in text.split("'")) + ")"
+
+
+@lru_cache(maxsize=512)
+def _css_string(text: str) -> str:
+    """Quote text as a CSS string literal, escaping quotes and line breaks."""
+    escaped = text.replace("\\", "\\\\").replace("'", "\\'")
+    return "'" + escaped.replace("\n", "\\a ").replace("\r", "\\d ") + "'"
+
+
+@lru_cache(maxsize=512)
+def _text_locator(text: str, element_type: str) -> Tuple[str, str]:
+    """Build locator of an element containing text."""
+    # Only the first match in document order is needed
+    return By.XPATH, XPATH_TEXT.format(element_type, _xpath_literal(text))
+
+
+@lru_cache(maxsize=512)
+def _button_value_locator(value: str) -> Tuple[str, str]:
+    """Build locator of a submit button by its value."""
+    return By.XPATH, XPATH_BUTTON_VALUE.format(_xpath_literal(value))
+
+
+@lru_cache(maxsize=512)
+def _class_text_locator(class_name: str, text: str) -> Tuple[str, str]:
+    """Build locator of an element by its class and text."""
+    return By.XPATH, XPATH_CLASS_TEXT.format(
+        _xpath_literal(class_name), _xpath_literal(text)
+    )
+
+
+@lru_cache(maxsize=512)
+def _name_block_locator(parent_text: str) -> Tuple[str, str]:
+    """Build locator of a form field name block by its text."""
+    return By.XPATH, XPATH_NAME_BLOCK.format(_xpath_literal(parent_text))
+
+
+@lru_cache(maxsize=512)
+def _checkbox_position_locator(container_class: str, position: int) -> Tuple[str, str]:
+    """Build locator of a checkbox by its position in a container."""
+    # Scan only checkboxes and check their ancestors, not every element
+    return By.XPATH, XPATH_CHECKBOX_POSITION.format(
+        _xpath_literal(container_class), position + 1
+    )
+
+
+@lru_cache(maxsize=512)
+def _container_button_locator(
+    container_class: str, button_type: str
+) -> Tuple[str, str]:
+    """Build locator of a button inside a container."""
+    return By.CSS_SELECTOR, CSS_CONTAINER_BUTTON.format(
+        _css_string(container_class), _css_string(button_type)
+    )
+
+
+class _DriverPool:
+    """Keeps started browsers for reuse until the process exits."""
+
+    def __init__(self):
+        # Idle browsers per endpoint they are attached to (None: own Chrome)
+        self._idle: Dict[Optional[str], queue.Queue] = defaultdict(queue.Queue)
+        self._managers: List["WebDriverManager"] = []
+        self._lock = threading.Lock()
+        atexit.register(self.shutdown)
+
+    def acquire(self, cdp_endpoint: Optional[str] = None) -> "WebDriverManager":
+        """Get an idle browser, starting a new one if none is available."""
+        while True:
+            try:
+                manager = self._idle[cdp_endpoint].get_nowait()
+            except queue.Empty:
+                break
+            if manager.is_alive():
+                return manager
+            self._discard(manager)
+
+        manager = WebDriverManager(cdp_endpoint=cdp_endpoint)
+        with self._lock:
+            self._managers.append(manager)
+        return manager
+
+    def release(self, manager: "WebDriverManager") -> None:
+        """Reset browser state and return it to the pool."""
+        try:
+            manager.reset()
+        except Exception:
+            self._discard(manager)
+            return
+        self._idle[manager.cdp_endpoint].put(manager)
+
+    def _discard(self, manager: "WebDriverManager") -> None:
+        """Quit a browser and forget it."""
+        with self._lock:
+            if manager in self._managers:
+                self._managers.remove(manager)
+        try:
+            manager.quit()
+        except Exception:
+            pass
+
+    def shutdown(self) -> None:
+        """Quit all browsers started by the pool."""
+        with self._lock:
+            managers, self._managers = self._managers, []
+        for manager in managers:
+            try:
+                manager.quit()
+            except Exception:
+                pass
+
 
 class WebDriverManager:
     """Manages WebDriver setup and basic operations."""
 
-    def __init__(self, wait_timeout: int = 20):
-        self.driver = self._setup_driver()
-        self.wait = WebDriverWait(self.driver, wait_timeout)
+    def __init__(self, wait_timeout: int = 20, cdp_endpoint: Optional[str] = None):
+        # Attach to a shared running browser instead of starting one, if given
+        self.cdp_endpoint = cdp_endpoint or os.environ.get(CDP_ENDPOINT_ENV) or None
+        self._profile_dir = None if self.cdp_endpoint else self._create_profile_dir()
+        self.driver = self._setup_driver(
+            self.cdp_endpoint,
+            self._profile_dir,
+            headless=os.environ.get(HEADLESS_ENV) != "0",
+        )
+        # Work in an own tab of a shared browser, leaving other tabs alone
+        if self.cdp_endpoint:
+            self.driver.switch_to.new_window("tab")
+        self._home_handle = self.driver.current_window_handle
+        # Rely on explicit waits only, so optional element probes return instantly
+        self.driver.implicitly_wait(0)
+        self.wait = WebDriverWait(
+            self.driver,
+            wait_timeout,
+            poll_frequency=0.05,
+            ignored_exceptions=(StaleElementReferenceException,),
+        )
+        # Direct (By, value) locators resolved from slow XPath text scans
+        self._locator_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        # Elements found by locator, dropped once they go stale
+        self._element_cache: Dict[Tuple[str, str], WebElement] = {}
+
+    @classmethod
+    def acquire(cls, cdp_endpoint: Optional[str] = None) -> "WebDriverManager":
+        """Get a browser from the process-wide pool, reusing a started one.
+
+        Args:
+            cdp_endpoint: "host:port" of a running Chrome to attach to
+        """
+        return _DRIVER_POOL.acquire(
+            cdp_endpoint or os.environ.get(CDP_ENDPOINT_ENV) or None
+        )
+
+    def release(self) -> None:
+        """Return the browser to the pool instead of quitting it."""
+        _DRIVER_POOL.release(self)
+
+    def is_alive(self) -> bool:
+        """Check that the browser still responds to commands."""
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def reset(self) -> None:
+        """Drop session state so the browser can serve a new search."""
+        self._element_cache.clear()
+        self._locator_cache.clear()
+        self.driver.switch_to.window(self._home_handle)
+        if self.cdp_endpoint:
+            # Cookies and tabs of a shared browser belong to other runs too
+            return
+
+        self.driver.delete_all_cookies()
+        for handle in self.driver.window_handles:
+            if handle != self._home_handle:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+        self.driver.switch_to.window(self._home_handle)
+
+    def quit(self) -> None:
+        """Quit the driver, closing only the own tab of a shared browser."""
+        if self.cdp_endpoint:
+            try:
+                self.driver.switch_to.window(self._home_handle)
+                self.driver.close()
+            except Exception:
+                pass
+        try:
+            self.driver.quit()
+        finally:
+            # A dead browser must not leave its profile in memory
+            if self._profile_dir:
+                shutil.rmtree(self._profile_dir, ignore_errors=True)
+
+    @staticmethod
+    def _create_profile_dir() -> Optional[str]:
+        """Create a browser profile directory in memory-backed /dev/shm."""
+        if not sys.platform.startswith("linux") or not os.path.isdir("/dev/shm"):
+            return None
+        return tempfile.mkdtemp(prefix="fips-profile-", dir="/dev/shm")
 
     @staticmethod
-    def _setup_driver() -> webdriver.Chrome:
-        """Configure and create Chrome WebDriver."""
+    def _setup_driver(
+        cdp_endpoint: Optional[str] = None,
+        profile_dir: Optional[str] = None,
+        headless: bool = True,
+    ) -> webdriver.Chrome:
+        """Configure and create Chrome WebDriver.
+
+        Args:
+            cdp_endpoint: "host:port" of a running Chrome to attach to
+            profile_dir: Directory for the browser profile and disk cache
+            headless: Run without a window and background browser activity
+        """
         options = Options()
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        return webdriver.Chrome(options=options)
+        binary = os.environ.get(CHROME_BINARY_ENV)
+        if binary and not cdp_endpoint:
+            options.binary_location = binary
+        # Return from navigation at DOMContentLoaded; callers wait for elements
+        options.page_load_strategy = "eager"
+        if cdp_endpoint:
+            # Browser flags were set when the shared browser was launched
+            options.add_experimental_option("debuggerAddress", cdp_endpoint)
+        else:
+            if headless:
+                for argument in HEADLESS_ARGS:
+                    options.add_argument(argument)
+            options.add_argument("--window-size=1920,1080")
+            options.add_argument("--no-sandbox")
+            if profile_dir:
+                # Keep profile and cache writes off the disk
+                options.add_argument(f"--user-data-dir={profile_dir}")
+                options.add_argument(f"--disk-cache-dir={profile_dir}/cache")
+                options.add_argument("--aggressive-cache-discard")
+            # Pages are only scraped, so skip loading images, stylesheets and
+            # fonts, and never show notification prompts
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_experimental_option("prefs", CONTENT_PREFS)
+        driver = webdriver.Chrome(options=options, keep_alive=True)
+
+        # Reuse persistent connections to the driver for every command
+        connection = getattr(driver.command_executor, "_conn", None)
+        if connection is not None:
+            connection.connection_pool_kw["maxsize"] = COMMAND_POOL_SIZE
+            connection.connection_pool_kw["block"] = False
+            connection.headers["Connection"] = "keep-alive"
+            connection.clear()
+        return driver
+
+    def wait_for_element(self, locator: Tuple[str, str]) -> WebElement:
+        """Wait for element to be present and return it.
+
+        Args:
+            locator: (By, value) pair of the element
+        """
+        return self.wait.until(EC.presence_of_element_located(locator))
+
+    def _find_cached(
+        self, locator: Tuple[str, str], relative_xpath: Optional[str] = None
+    ) -> WebElement:
+        """Find element by locator, reusing its resolved id or name afterwards.
 
-    def wait_for_element(self, selector: str, by: By = By.ID) -> WebElement:
-        """Wait for element to be present and return it."""
-        return self.wait.until(EC.presence_of_element_located((by, selector)))
+        Form controls keep their name and id within a session, so once an
+        XPath scan has found one, later lookups go straight to it.
+
+        Args:
+            locator: (By, value) pair of the element, or of its anchor
+            relative_xpath: Path from the anchor to the element, if any
+
+        Returns:
+            WebElement if found
+        """
+        # An element found earlier is reused while it is still attached
+        element = self._element_cache.get(locator)
+        if element is not None:
+            try:
+                element.is_enabled()
+                return element
+            except (StaleElementReferenceException, NoSuchElementException):
+                del self._element_cache[locator]
+
+        resolved = self._locator_cache.get(locator)
+        if resolved:
+            try:
+                element = self.driver.find_element(*resolved)
+                self._element_cache[locator] = element
+                return element
+            except NoSuchElementException:
+                del self._locator_cache[locator]
+
+        if relative_xpath:
+            element = self.wait.until(self._relative_element(locator, relative_xpath))
+        else:
+            element = self.wait.until(EC.presence_of_element_located(locator))
+        # Ids are unique; names are shared by checkbox groups and JSF controls
+        element_id = element.get_attribute("id")
+        if element_id:
+            self._locator_cache[locator] = (By.ID, element_id)
+        else:
+            name = element.get_attribute("name")
+            if name:
+                self._locator_cache[locator] = (By.NAME, name)
+        self._element_cache[locator] = element
+        return element
+
+    @staticmethod
+    def _relative_element(locator: Tuple[str, str], relative_xpath: str):
+        """Build wait condition for the first anchor's neighbour found by path.
+
+        Anchors are tried in document order until one has the element, and
+        the search is repeated until the element has rendered.
+        """
+
+        def _predicate(driver):
+            # Search only the anchors' neighbourhood, not the whole document
+            for anchor in driver.find_elements(*locator):
+                found = anchor.find_elements(By.XPATH, relative_xpath)
+                if found:
+                    return found[0]
+            return False
+
+        return _predicate
 
     def click_element(self, element: WebElement) -> None:
         """Click element using JavaScript for better reliability.
@@ -34,8 +430,23 @@ class WebDriverManager:
         Args:
             element: WebElement to click
         """
+        # Callers wait for the exact state change they need afterwards
         self.driver.execute_script("arguments[0].click();", element)
-        time.sleep(0.5)  # Small delay after click
+
+    def set_input_value(self, element: WebElement, value: str) -> None:
+        """Replace input value in one call instead of typing it key by key.
+
+        Args:
+            element: Input WebElement
+            value: Text to put into the input
+        """
+        self.driver.execute_script(
+            "arguments[0].value = arguments[1];"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+            "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
+            element,
+            value,
+        )
 
     def wait_for_page_load(self, timeout: int = 20) -> None:
         """Wait for page to complete loading with improved reliability.
@@ -43,29 +454,14 @@ class WebDriverManager:
         Args:
             timeout: Maximum time to wait in seconds
         """
-        # Wait for document ready state
+        # Wait for document ready state and idle jQuery (if present) together
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState")
-                == "complete"
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                lambda driver: driver.execute_script(JS_PAGE_READY)
             )
-
-            # Also wait for jQuery to complete (if present)
-            try:
-                WebDriverWait(self.driver, 5).until(
-                    lambda driver: driver.execute_script(
-                        "return typeof jQuery !== 'undefined' && jQuery.active === 0"
-                    )
-                )
-            except Exception:
-                # jQuery may not be present, which is fine
-                pass
-
-            # Wait a short time for any animations to complete
-            time.sleep(0.3)
         except Exception as e:
             # Log but continue if timeout occurs
-            print(f"Warning: Page load wait timed out: {e}")
+            logger.warning(f"Page load wait timed out: {e}")
 
     def find_element_by_text(self, text: str, element_type: str = "*") -> WebElement:
         """Find element by its text content.
@@ -77,23 +473,30 @@ class WebDriverManager:
         Returns:
             WebElement if found
         """
-        xpath = f"//{element_type}[contains(text(), '{text}')]"
-        return self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
+        locator = _text_locator(text, element_type)
+        return self.wait.until(EC.presence_of_element_located(locator))
 
-    def find_checkbox_by_label(self, label_text: str) -> WebElement:
-        """Find checkbox by its label text.
+    def set_checkboxes(self, wanted: Dict[str, bool]) -> Dict[str, Optional[bool]]:
+        """Bring several checkboxes to the wanted state in one call.
 
         Args:
-            label_text: Text of the label associated with checkbox
+            wanted: Mapping of label text to desired checked state
 
         Returns:
-            WebElement (checkbox) if found
+            Mapping of label text to the state before the call (None if not found)
         """
-        xpath = (
-            f"//label[normalize-space(text())='{label_text}']"
-            f"/preceding-sibling::input[@type='checkbox'][1]"
+        return self.driver.execute_script(
+            JS_FIND_CHECKBOX_BY_LABEL + """
+            const states = {};
+            for (const [text, checked] of Object.entries(arguments[0])) {
+                const input = findCheckbox(text);
+                states[text] = input ? input.checked : null;
+                if (input && input.checked !== checked) input.click();
+            }
+            return states;
+            """,
+            wanted,
         )
-        return self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
 
     def find_button_by_value(self, value: str) -> WebElement:
         """Find button by its value attribute.
@@ -104,8 +507,7 @@ class WebDriverManager:
         Returns:
             WebElement if found
         """
-        xpath = f"//input[@type='submit' and contains(@value, '{value}')]"
-        return self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
+        return self._find_cached(_button_value_locator(value))
 
     def find_element_by_class_and_text(self, class_name: str, text: str) -> WebElement:
         """Find element by its class and text content.
@@ -117,8 +519,8 @@ class WebDriverManager:
         Returns:
             WebElement if found
         """
-        xpath = f"//*[contains(@class, '{class_name}') and contains(text(), '{text}')]"
-        return self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
+        locator = _class_text_locator(class_name, text)
+        return self.wait.until(EC.presence_of_element_located(locator))
 
     def find_input_by_parent_text(self, parent_text: str) -> WebElement:
         """Find input element by text in its parent element.
@@ -129,12 +531,9 @@ class WebDriverManager:
         Returns:
             WebElement (input) if found
         """
-        xpath = (
-            f"//div[contains(@class, 'oneblock')]"
-            f"//div[contains(@class, 'name')][contains(., '{parent_text}')]"
-            f"/following-sibling::div[contains(@class, 'input')]//input"
+        return self._find_cached(
+            _name_block_locator(parent_text), INPUT_AFTER_NAME_XPATH
         )
-        return self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
 
     def find_checkbox_by_position(
         self, container_class: str, position: int
@@ -148,11 +547,7 @@ class WebDriverManager:
         Returns:
             WebElement (checkbox) if found
         """
-        xpath = (
-            f"(//*[contains(@class, '{container_class}')]//input[@type='checkbox'])"
-            f"[{position + 1}]"
-        )
-        return self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
+        return self._find_cached(_checkbox_position_locator(container_class, position))
 
     def find_button_in_container(
         self, container_class: str, button_type: str = "submit"
@@ -166,16 +561,34 @@ class WebDriverManager:
         Returns:
             WebElement (button) if found
         """
-        xpath = (
-            f"//*[contains(@class, '{container_class}')]//input[@type='{button_type}']"
-        )
-        return self.wait.until(EC.presence_of_element_located((By.XPATH, xpath)))
+        locator = _container_button_locator(container_class, button_type)
+        return self.wait.until(EC.presence_of_element_located(locator))
+
+    def open_urls_in_tabs(self, urls: List[str]) -> List[str]:
+        """Open several URLs in new tabs, letting them load at the same time.
 
-    def open_url_in_new_tab(self, url: str) -> None:
-        """Open URL in a new tab and switch to it.
+        The driver is left on the last opened tab.
 
         Args:
-            url: URL to open
+            urls: URLs to open
+
+        Returns:
+            Handles of the new tabs in the order of urls; fewer than urls if
+            the browser failed to open a tab
         """
-        self.driver.execute_script(f'window.open("{url}","_blank");')
-        self.driver.switch_to.window(self.driver.window_handles[-1])
+        handles = []
+        for url in urls:
+            try:
+                self.driver.switch_to.new_window("tab")
+                handles.append(self.driver.current_window_handle)
+                # Start navigation without waiting for the page to load
+                self.driver.execute_script("location.href = arguments[0];", url)
+            except WebDriverException as e:
+                logger.warning(f"Failed to open tab for {url}: {e}")
+                break
+        # Elements of the previous tab are not reachable from the new ones
+        self._element_cache.clear()
+        return handles
+
+
+_DRIVER_POOL = _DriverPool()
@@ -1,14 +1,33 @@
+from dataclasses import asdict
 from pathlib import Path
 
+from fips.browser_pool import read_endpoint
 from fips.models import StatusOptions
 from fips.parser import FIPSParser
+from fips.service import request_search
 
 
 def main():
     """Main entry point."""
     base_dir = Path.cwd()
     status_options = StatusOptions(active=True)
-    parser = FIPSParser(base_dir=base_dir, status_options=status_options)
+
+    # Hand the search to a running fips.service, which keeps its browser open
+    response = request_search(
+        {"base_dir": str(base_dir), "status_options": asdict(status_options)}
+    )
+    if response is not None:
+        print(f"\nFound results: {response['results']}")
+        print(f"Results saved to: {response['csv_path']}")
+        print(f"Detailed information saved to: {response['patents_dir']}")
+        return
+
+    # Attach to the shared browser if one was started with fips.browser_pool
+    parser = FIPSParser(
+        base_dir=base_dir,
+        status_options=status_options,
+        cdp_endpoint=read_endpoint(),
+    )
 
     try:
         results = parser.start_search()
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from fips.browser_pool import read_endpoint
 from fips.models import StatusOptions
 from fips.parser import FIPSParser
 
@@ -9,8 +10,12 @@ def main():
     test_mode = True
     base_dir = Path.cwd()
     status_options = StatusOptions()
+    # Attach to the shared browser if one was started with fips.browser_pool
     parser = FIPSParser(
-        base_dir=base_dir, status_options=status_options, test_mode=test_mode
+        base_dir=base_dir,
+        status_options=status_options,
+        test_mode=test_mode,
+        cdp_endpoint=read_endpoint(),
     )
 
     try: